@@ -1,3 +1,5 @@
+import functools
+import math
 import numpy as np
 from node import *
 
@@ -18,22 +20,29 @@ def discretizateBar(left_node, right_node, q, E, A, n_elements):
     - nodes (list): List of intermediate nodes between left_node and right_node.
     """
     left_node_position, right_node_position = left_node.getPosition(), right_node.getPosition()
-    left_node_x, left_node_y = left_node_position[0], left_node_position[1]
-    right_node_x, right_node_y = right_node_position[0], right_node_position[1]
-    dx = (right_node_x - left_node_x) / n_elements
-    dy = (right_node_y - left_node_y) / n_elements
-    bars = []
-    nodes = []
-    for i in range(1, n_elements):
-        node = Node(x = left_node_x + i*dx, y = left_node_y + i*dy, fx = 0, fy = 0, fixed_in_x = False, fixed_in_y = False)
-        nodes.append(node)
-    for i in range(n_elements):
-        node_i = left_node if i == 0 else nodes[i-1]
-        node_j = right_node if i == n_elements-1 else nodes[i]
-        bar = Bar(left_node = node_i, right_node = node_j, q = q, E = E, A = A)
-        bars.append(bar)
+    xs = np.linspace(left_node_position[0], right_node_position[0], n_elements + 1)[1:-1]
+    ys = np.linspace(left_node_position[1], right_node_position[1], n_elements + 1)[1:-1]
+    nodes = [Node(x = float(x), y = float(y), fx = 0, fy = 0, fixed_in_x = False, fixed_in_y = False) for x, y in zip(xs, ys)]
+    bar_nodes = [left_node] + nodes + [right_node]
+    bars = [Bar(left_node = node_i, right_node = node_j, q = q, E = E, A = A) for node_i, node_j in zip(bar_nodes[:-1], bar_nodes[1:])]
     return bars, nodes
 
+def calculateBarsProjections(positions, left_nodes_indexes, right_nodes_indexes):
+    """
+    Function to calculate the projections of several bars at once.
+
+    Parameters:
+    - positions (numpy.ndarray): The nodes positions, with shape (n_nodes, 2).
+    - left_nodes_indexes (numpy.ndarray): The row of the left node of each bar in positions.
+    - right_nodes_indexes (numpy.ndarray): The row of the right node of each bar in positions.
+
+    Returns:
+    - dx (numpy.ndarray): The horizontal projection of each bar.
+    - dy (numpy.ndarray): The vertical projection of each bar.
+    """
+    projections = positions[right_nodes_indexes] - positions[left_nodes_indexes]
+    return projections[:, 0], projections[:, 1]
+
 class Bar:
     def __init__(self, left_node, right_node, q, E, A):
         """
@@ -58,20 +67,34 @@ class Bar:
         self.right_node = right_node
         self.E = E
         self.A = A
+        self.dx, self.dy = self.calculateBarProjections()
         self.L = self.calculateBarLength()
-        self.Li = self.calculateBarLength()
+        self.Li = self.L
         self.angle = self.getBarAngle()
-        self.stiffness_matrix = self.calculateStiffnessMatrix()
         self.load = q
         self.N = 0
         self.sigma = 0
+        self.bar_array = None
+        self.bar_array_index = None
         
     def getBarLength(self):
         """
         Get the length of the bar.
         """
+        self.pullFromBarArray()
         return self.L
     
+    def calculateBarProjections(self):
+        """
+        Calculate the projections of the bar on the x and y axes.
+        
+        :return: The horizontal and vertical projections of the bar.
+        :rtype: tuple(float, float)
+        """
+        dx = self.right_node.position[0] - self.left_node.position[0]
+        dy = self.right_node.position[1] - self.left_node.position[1]
+        return float(dx), float(dy)
+
     def calculateBarLength(self):
         """
         Calculate the length of the bar.
@@ -79,7 +102,7 @@ class Bar:
         :return: The length of the bar.
         :rtype: float
         """
-        return np.linalg.norm(self.left_node.position - self.right_node.position)
+        return math.hypot(self.dx, self.dy)
         
     def calculateStiffnessMatrix(self):
         """
@@ -88,16 +111,27 @@ class Bar:
         :return: The stiffness matrix.
         :rtype: numpy.ndarray
         """
-        c = np.cos(self.angle)
-        s = np.sin(self.angle)
+        c = math.cos(self.angle)
+        s = math.sin(self.angle)
         k = self.E * self.A / self.L
-        K = k * np.array([[c**2, c * s, -c**2, -c * s],
-                          [c * s, s**2, -c * s, -s**2],
-                          [-c**2, -c * s, c**2, c * s],
-                          [-c * s, -s**2, c * s, s**2]])
+        
+        # K = [[B, -B], [-B, B]] with B symmetric: only 3 unique entries.
+        K = np.empty((4, 4))
+        K[0, 0] = k * c * c
+        K[0, 1] = K[1, 0] = k * c * s
+        K[1, 1] = k * s * s
+        K[2:, 2:] = K[:2, :2]
+        K[:2, 2:] = K[2:, :2] = -K[:2, :2]
         
         return K
     
+    @functools.cached_property
+    def stiffness_matrix(self):
+        """
+        The stiffness matrix of the bar, calculated on first access.
+        """
+        return self.calculateStiffnessMatrix()
+
     def getStiffnessMatrix(self):
         """
         Gets the stiffness matrix of the bar.
@@ -105,6 +139,7 @@ class Bar:
         :return: The stiffness matrix.
         :rtype: numpy.ndarray
         """
+        self.pullFromBarArray()
         return self.stiffness_matrix
     
     def getBarAngle(self):
@@ -114,34 +149,58 @@ class Bar:
         :return: The angle of the bar
         :rtype: float
         """
-        dx = self.right_node.position[0] - self.left_node.position[0]
-        dy = self.right_node.position[1] - self.left_node.position[1]
-        
-        if dx == 0:  
-            if dy > 0:
-                return np.pi / 2  
-            else:   
-                return -np.pi / 2  
-        else:
-            return np.arctan(dy / dx)
+        return math.atan2(self.dy, self.dx)
         
     def updateNodeForces(self):
         """
         Computes the load forces in the bar nodes.
         """
+        self.pullFromBarArray()
         factor = self.load * self.L / 2
-        delta_f_x, delta_f_y = factor * np.cos(self.angle), factor * np.sin(self.angle)
+        delta_f_x, delta_f_y = factor * math.cos(self.angle), factor * math.sin(self.angle)
         self.left_node.addNewForce(delta_f_x, delta_f_y)
         self.right_node.addNewForce(delta_f_x, delta_f_y)
 
+    def updateGeometry(self, dx, dy):
+        """
+        Updates the projections, length and angle of the bar, discarding its cached stiffness matrix.
+
+        :param dx: The current horizontal projection of the bar.
+        :type dx: float
+        :param dy: The current vertical projection of the bar.
+        :type dy: float
+        """
+        self.dx, self.dy = float(dx), float(dy)
+        self.L = self.calculateBarLength()
+        self.angle = self.getBarAngle()
+        self.__dict__.pop('stiffness_matrix', None)
+
+    def pullFromBarArray(self):
+        """
+        Copies the geometry, stress and normal force of the bar from its BarArray,
+        if they were updated there since the last copy.
+        """
+        bar_array = self.bar_array
+        if bar_array is not None and bar_array.pending[self.bar_array_index]:
+            i = self.bar_array_index
+            bar_array.pending[i] = False
+            self.updateGeometry(bar_array.dx[i], bar_array.dy[i])
+            self.sigma = float(bar_array.sigma[i])
+            self.N = float(bar_array.N[i])
+
     def setBarNormalAndStress(self):
         """
         Calculates the stress and normal force of the bar.
+
+        To update all bars of a structure at once, use BarArray.updateNormalsAndStresses.
+        If the bar belongs to a BarArray, the new values are also written to it.
         """
-        self.L = self.calculateBarLength() 
+        self.updateGeometry(*self.calculateBarProjections())
         sigma = self.E * (self.L - self.Li) / self.Li 
         self.sigma = sigma 
         self.N = sigma * self.A  
+        if self.bar_array is not None:
+            self.bar_array.pushBar(self.bar_array_index)
 
 
     def getBarNormal(self):
@@ -151,6 +210,7 @@ class Bar:
         :return: The normal of the bar.
         :rtype: float
         """
+        self.pullFromBarArray()
         return self.N
     
     def getBarStress(self):
@@ -160,4 +220,78 @@ class Bar:
         :return: The stress of the bar.
         :rtype: float
         """
-        return self.sigma
\ No newline at end of file
+        self.pullFromBarArray()
+        return self.sigma
+
+
+class BarArray:
+    def __init__(self, list_of_bars):
+        """
+        Initializes a BarArray object, storing the bars properties as parallel arrays.
+
+        The arrays are the reference values of the bars: after a vectorized update, each bar
+        copies its own values back when they are read through its getters.
+
+        :param list_of_bars: List of bars.
+        :type list_of_bars: list of _Bar_
+        """
+        self.bars = list_of_bars
+        self.E = np.array([bar.E for bar in self.bars], dtype = np.float64)
+        self.A = np.array([bar.A for bar in self.bars], dtype = np.float64)
+        self.Li = np.array([bar.Li for bar in self.bars], dtype = np.float64)
+        self.dx = np.array([bar.dx for bar in self.bars], dtype = np.float64)
+        self.dy = np.array([bar.dy for bar in self.bars], dtype = np.float64)
+        self.L = np.array([bar.L for bar in self.bars], dtype = np.float64)
+        self.sigma = np.array([bar.sigma for bar in self.bars], dtype = np.float64)
+        self.N = np.array([bar.N for bar in self.bars], dtype = np.float64)
+        # Bars whose attributes are behind the arrays.
+        self.pending = np.zeros(len(self.bars), dtype = bool)
+        for i, bar in enumerate(self.bars):
+            bar.bar_array = self
+            bar.bar_array_index = i
+
+    def updateNormalsAndStresses(self, dx, dy):
+        """
+        Calculates the stresses and normal forces of all bars at once.
+
+        :param dx: The current horizontal projection of each bar.
+        :type dx: numpy.ndarray
+        :param dy: The current vertical projection of each bar.
+        :type dy: numpy.ndarray
+        """
+        self.dx = np.array(dx, dtype = np.float64)
+        self.dy = np.array(dy, dtype = np.float64)
+        self.L = np.hypot(self.dx, self.dy)
+        self.sigma = self.E * (self.L - self.Li) / self.Li
+        self.N = self.sigma * self.A
+        self.pending[:] = True
+
+    def pushBar(self, i):
+        """
+        Copies the geometry, stress and normal force of a bar into the arrays.
+
+        :param i: The position of the bar.
+        :type i: int
+        """
+        bar = self.bars[i]
+        self.dx[i], self.dy[i], self.L[i] = bar.dx, bar.dy, bar.L
+        self.sigma[i], self.N[i] = bar.sigma, bar.N
+        self.pending[i] = False
+
+    def getNormals(self):
+        """
+        Gets the normal forces of all bars.
+
+        :return: The normal force of each bar.
+        :rtype: numpy.ndarray
+        """
+        return self.N
+
+    def getStresses(self):
+        """
+        Gets the stresses of all bars.
+
+        :return: The stress of each bar.
+        :rtype: numpy.ndarray
+        """
+        return self.sigma
@@ -1,3 +1,4 @@
+import warnings
 import numpy as np
 
 class Node:
@@ -97,4 +98,38 @@ class Node:
         :return: The fixed state of the node.
         :rtype: bool
         """
-        return (self.constraints['isFixedInX'], self.constraints['isFixedInY'])
\ No newline at end of file
+        return (self.constraints['isFixedInX'], self.constraints['isFixedInY'])
+
+
+class NodeTable:
+    def __init__(self, list_of_nodes):
+        """
+        Initializes a NodeTable object, storing the nodes positions as a single array.
+
+        The position of each node becomes a view of its row in the table, so node position
+        updates are seen by the table and vice versa. A node belongs to one table at a time:
+        if it already belongs to another table, that table stops following its position and
+        a warning is issued.
+
+        :param list_of_nodes: List of nodes.
+        :type list_of_nodes: list of _Node_
+        """
+        self.nodes = list_of_nodes
+        self.positions = np.array([node.getPosition() for node in self.nodes], dtype = np.float64).reshape(len(self.nodes), 2)
+        self.indexes = {id(node): i for i, node in enumerate(self.nodes)}
+        # A node created by Node owns its position array; a view means it is a row of another table.
+        if any(node.position.base is not None for node in self.nodes):
+            warnings.warn('Some nodes already belong to another NodeTable, which will no longer follow their positions.', stacklevel = 2)
+        for i, node in enumerate(self.nodes):
+            node.position = self.positions[i]
+
+    def getIndexes(self, nodes):
+        """
+        Gets the rows of the given nodes in the table.
+
+        :param nodes: The nodes to look up.
+        :type nodes: list of _Node_
+        :return: The index of each node.
+        :rtype: numpy.ndarray
+        """
+        return np.array([self.indexes[id(node)] for node in nodes], dtype = np.int64)
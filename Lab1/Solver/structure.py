@@ -1,5 +1,5 @@
-from node import Node
-from bar import Bar
+from node import Node, NodeTable
+from bar import Bar, BarArray, calculateBarsProjections
 
 import numpy as np
 import sympy as sp
@@ -11,6 +11,10 @@ class Structure:
         """
         Initializes a structure object.
 
+        The nodes positions are moved into the structure NodeTable, so each node must belong
+        to a single structure: building another structure from the same nodes detaches them
+        from this one, whose bar projections then use stale positions.
+
         :param list_of_nodes: List of nodes in the system.
         :type list_of_nodes: list of _Node_
         :param list_of_bars: List of bars in the system.
@@ -19,6 +23,10 @@ class Structure:
         self.nodes = list_of_nodes
         self.bars = list_of_bars
         self.num_nodes = len(self.nodes)
+        self.node_table = NodeTable(self.nodes)
+        self.left_nodes_indexes = self.node_table.getIndexes([bar.left_node for bar in self.bars])
+        self.right_nodes_indexes = self.node_table.getIndexes([bar.right_node for bar in self.bars])
+        self.bar_array = BarArray(self.bars)
         self.K = self.calculateStiffnessMatrix()
         self.f = self.calculateForceVector()
         self.symbols = []
@@ -40,10 +48,7 @@ class Structure:
         """
         global_matrix = np.zeros((2 * self.num_nodes, 2 * self.num_nodes))
 
-        for bar in self.bars:
-            i = self.nodes.index(bar.left_node)
-            j = self.nodes.index(bar.right_node)
-            
+        for bar, i, j in zip(self.bars, self.left_nodes_indexes, self.right_nodes_indexes):
             local_matrix = bar.getStiffnessMatrix()
             
             global_matrix[2*i:2*(i+1), 2*i:2*(i+1)] += local_matrix[:2, :2]
@@ -169,19 +174,20 @@ class Structure:
         """
         Sets the normals and stresses of the bars based on the system solution.
         """
-        for bar in self.bars:
-            bar.setBarNormalAndStress()
+        dx, dy = calculateBarsProjections(self.node_table.positions, self.left_nodes_indexes, self.right_nodes_indexes)
+        self.bar_array.updateNormalsAndStresses(dx, dy)
             
     def getBarsStressesAndNormals(self):
         """
         Gets the stresses and normals of the bars.
         """
         keys, values = [], []
-        for i, bar in enumerate(self.bars):
+        normals, stresses = self.bar_array.getNormals().tolist(), self.bar_array.getStresses().tolist()
+        for i in range(len(self.bars)):
             keys.append(f'N_{i+1}')
             keys.append(f'sigma_{i+1}')
-            values.append(bar.getBarNormal())
-            values.append(bar.getBarStress())
+            values.append(normals[i])
+            values.append(stresses[i])
         infos = dict(zip(keys, values))
         return infos
 
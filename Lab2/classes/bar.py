@@ -1,8 +1,370 @@
+import functools
+import math
 import numpy as np
 import sympy as sp
 from scipy.integrate import quad
 from node import Node
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Fallback decorator used when Numba is not installed: returns the function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+# 5-point Gauss-Legendre rule on [-1, 1]: exact up to degree 9, i.e. a cubic shape function times a load of degree up to 6.
+GAUSS_POINTS, GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(5)
+GAUSS_U = 0.5 * (GAUSS_POINTS + 1)
+
+# Highest load polynomial degree integrated exactly by the Gauss rule (cubic shape functions).
+GAUSS_EXACT_LOAD_DEGREE = 6
+
+# Shape functions on the reference element [0, 1].
+# Rows 2 and 5 (rotations) must still be multiplied by the bar length.
+REFERENCE_SHAPE_FUNCTIONS = [
+    lambda u: 1 - u,
+    lambda u: 2 * u**3 - 3 * u**2 + 1,
+    lambda u: u**3 - 2 * u**2 + u,
+    lambda u: u,
+    lambda u: -2 * u**3 + 3 * u**2,
+    lambda u: u**3 - u**2
+]
+
+# Shape functions tabulated at the Gauss points of the reference element.
+SHAPE_FUNCTIONS = np.stack([shape_function(GAUSS_U) for shape_function in REFERENCE_SHAPE_FUNCTIONS])
+
+def isPolynomialLoad(load):
+    """
+    Checks whether a distributed load is integrated exactly by the Gauss rule.
+
+    Constant loads are always polynomial; load functions must declare their degree
+    through a ``polynomial_degree`` attribute.
+
+    :param load: The load value or function.
+    :type load: float or function
+    :return: True if the load is a polynomial of degree up to GAUSS_EXACT_LOAD_DEGREE.
+    :rtype: bool
+    """
+    if isinstance(load, (int, float)):
+        return True
+    degree = getattr(load, 'polynomial_degree', None)
+    return degree is not None and degree <= GAUSS_EXACT_LOAD_DEGREE
+
+def evaluateLoad(load, x):
+    """
+    Evaluates a distributed load at an array of points.
+
+    Loads that cannot take the whole array at once (e.g. with an ``if`` on x) are evaluated point by point.
+
+    :param load: The load function.
+    :type load: function
+    :param x: The points where the load is evaluated.
+    :type x: numpy.ndarray
+    :return: The load values at each point.
+    :rtype: numpy.ndarray
+    """
+    try:
+        values = np.asarray(load(x), dtype=np.float64)
+    except (TypeError, ValueError):
+        values = None
+    if values is None or values.shape not in ((), x.shape):
+        values = np.vectorize(load, otypes=[np.float64])(x)
+    return np.broadcast_to(values, x.shape)
+
+# Below this value, the sine or cosine of the bar angle is treated as zero (axis-aligned bar).
+AXIS_TOLERANCE = 1e-14
+
+# Rotation matrices shared between bars, keyed by the bar angle rounded to 12 decimals.
+ROTATION_MATRICES = {}
+ROTATION_MATRICES_MAXSIZE = 4096
+
+def calculateRotationMatrices(angle):
+    """
+    Calculates the 6x6 and 3x3 rotation matrices for the given angle.
+
+    The matrices are cached by the angle rounded to 12 decimals and shared between bars with
+    the same rounded angle, so they are read-only. They are built from the exact cosine and sine
+    of the first angle seen, so horizontal and vertical bars keep their exact zeros.
+
+    :param angle: The bar angle.
+    :type angle: float
+    :return: A tuple containing the 6x6 and 3x3 rotation matrices.
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
+    """
+    key = round(angle, 12)
+    rotation_matrices = ROTATION_MATRICES.get(key)
+    if rotation_matrices is None:
+        if len(ROTATION_MATRICES) >= ROTATION_MATRICES_MAXSIZE:
+            ROTATION_MATRICES.clear()
+
+        c = math.cos(angle)
+        s = math.sin(angle)
+
+        R_6 = np.zeros((6, 6))
+        R_6[0, 0] = R_6[1, 1] = R_6[3, 3] = R_6[4, 4] = c
+        R_6[0, 1] = R_6[3, 4] = -s
+        R_6[1, 0] = R_6[4, 3] = s
+        R_6[2, 2] = R_6[5, 5] = 1.0
+
+        R_3 = R_6[:3, :3].copy()
+
+        R_6.flags.writeable = False
+        R_3.flags.writeable = False
+        rotation_matrices = ROTATION_MATRICES[key] = (R_6, R_3)
+
+    return rotation_matrices
+
+@njit(cache=True)
+def calculateStiffnessTerms(c, s, L, E, A, I):
+    """
+    Calculates the distinct entries of the 6x6 stiffness matrix of a bar with any orientation.
+
+    Works on floats for a single bar or on arrays for several bars at once.
+
+    :param c: Cosine of the bar angle.
+    :type c: float or numpy.ndarray
+    :param s: Sine of the bar angle.
+    :type s: float or numpy.ndarray
+    :param L: Bar length.
+    :type L: float or numpy.ndarray
+    :param E: Young's modulus of the material.
+    :type E: float or numpy.ndarray
+    :param A: Cross-sectional area of the bar.
+    :type A: float or numpy.ndarray
+    :param I: Inertia Momentum of the bar.
+    :type I: float or numpy.ndarray
+    :return: The entries K[0, 0], K[1, 1], K[0, 1], -K[0, 2], K[1, 2] and K[2, 5].
+    :rtype: tuple
+    """
+    # axial = k * mu, with mu = A * L**2 / (2 * I), simplifies to E * A / L.
+    k = 2 * E * I / L**3
+    axial = E * A / L
+    bending = 6 * k
+    c2 = c * c
+    s2 = s * s
+
+    axial_c2_bending_s2 = axial * c2 + bending * s2
+    axial_s2_bending_c2 = axial * s2 + bending * c2
+    axial_bending_cs = (axial - bending) * c * s
+    k3Ls = 3 * k * L * s
+    k3Lc = 3 * k * L * c
+    kL2 = k * L * L
+
+    return axial_c2_bending_s2, axial_s2_bending_c2, axial_bending_cs, k3Ls, k3Lc, kL2
+
+@njit(cache=True)
+def fillGeneralStiffnessMatrix(c, s, L, E, A, I, K):
+    """
+    Fills the 6x6 stiffness matrix of a bar with any orientation.
+
+    :param c: Cosine of the bar angle.
+    :type c: float
+    :param s: Sine of the bar angle.
+    :type s: float
+    :param L: Bar length.
+    :type L: float
+    :param E: Young's modulus of the material.
+    :type E: float
+    :param A: Cross-sectional area of the bar.
+    :type A: float
+    :param I: Inertia Momentum of the bar.
+    :type I: float
+    :param K: The array where the stiffness matrix is written.
+    :type K: numpy.ndarray
+    """
+    axial_c2_bending_s2, axial_s2_bending_c2, axial_bending_cs, k3Ls, k3Lc, kL2 = calculateStiffnessTerms(c, s, L, E, A, I)
+
+    K[0, 0] = K[3, 3] = axial_c2_bending_s2
+    K[0, 3] = -axial_c2_bending_s2
+    K[1, 1] = K[4, 4] = axial_s2_bending_c2
+    K[1, 4] = -axial_s2_bending_c2
+    K[0, 1] = K[3, 4] = axial_bending_cs
+    K[0, 4] = K[1, 3] = -axial_bending_cs
+    K[0, 2] = K[0, 5] = -k3Ls
+    K[2, 3] = K[3, 5] = k3Ls
+    K[1, 2] = K[1, 5] = k3Lc
+    K[2, 4] = K[4, 5] = -k3Lc
+    K[2, 2] = K[5, 5] = 2 * kL2
+    K[2, 5] = kL2
+
+    for i in range(6):
+        for j in range(i):
+            K[i, j] = K[j, i]
+
+@njit(cache=True)
+def fillHorizontalStiffnessMatrix(c, L, E, A, I, K):
+    """
+    Fills the 6x6 stiffness matrix of a horizontal bar (sine of the angle equal to zero).
+
+    :param c: Cosine of the bar angle, 1 or -1.
+    :type c: float
+    :param L: Bar length.
+    :type L: float
+    :param E: Young's modulus of the material.
+    :type E: float
+    :param A: Cross-sectional area of the bar.
+    :type A: float
+    :param I: Inertia Momentum of the bar.
+    :type I: float
+    :param K: The array where the stiffness matrix is written.
+    :type K: numpy.ndarray
+    """
+    k = 2 * E * I / L**3
+    axial = E * A / L
+    bending = 6 * k
+    k3Lc = 3 * k * L * c
+    kL2 = k * L * L
+
+    K[:] = 0.0
+    K[0, 0] = K[3, 3] = axial
+    K[0, 3] = K[3, 0] = -axial
+    K[1, 1] = K[4, 4] = bending
+    K[1, 4] = K[4, 1] = -bending
+    K[1, 2] = K[2, 1] = K[1, 5] = K[5, 1] = k3Lc
+    K[2, 4] = K[4, 2] = K[4, 5] = K[5, 4] = -k3Lc
+    K[2, 2] = K[5, 5] = 2 * kL2
+    K[2, 5] = K[5, 2] = kL2
+
+@njit(cache=True)
+def fillVerticalStiffnessMatrix(s, L, E, A, I, K):
+    """
+    Fills the 6x6 stiffness matrix of a vertical bar (cosine of the angle equal to zero).
+
+    :param s: Sine of the bar angle, 1 or -1.
+    :type s: float
+    :param L: Bar length.
+    :type L: float
+    :param E: Young's modulus of the material.
+    :type E: float
+    :param A: Cross-sectional area of the bar.
+    :type A: float
+    :param I: Inertia Momentum of the bar.
+    :type I: float
+    :param K: The array where the stiffness matrix is written.
+    :type K: numpy.ndarray
+    """
+    k = 2 * E * I / L**3
+    axial = E * A / L
+    bending = 6 * k
+    k3Ls = 3 * k * L * s
+    kL2 = k * L * L
+
+    K[:] = 0.0
+    K[0, 0] = K[3, 3] = bending
+    K[0, 3] = K[3, 0] = -bending
+    K[1, 1] = K[4, 4] = axial
+    K[1, 4] = K[4, 1] = -axial
+    K[0, 2] = K[2, 0] = K[0, 5] = K[5, 0] = -k3Ls
+    K[2, 3] = K[3, 2] = K[3, 5] = K[5, 3] = k3Ls
+    K[2, 2] = K[5, 5] = 2 * kL2
+    K[2, 5] = K[5, 2] = kL2
+
+@njit(cache=True)
+def fillStiffnessMatrix(c, s, L, E, A, I, K):
+    """
+    Fills the 6x6 stiffness matrix of a bar, using the specialized kernels for horizontal and vertical bars.
+
+    :param c: Cosine of the bar angle.
+    :type c: float
+    :param s: Sine of the bar angle.
+    :type s: float
+    :param L: Bar length.
+    :type L: float
+    :param E: Young's modulus of the material.
+    :type E: float
+    :param A: Cross-sectional area of the bar.
+    :type A: float
+    :param I: Inertia Momentum of the bar.
+    :type I: float
+    :param K: The array where the stiffness matrix is written.
+    :type K: numpy.ndarray
+    """
+    if abs(s) < AXIS_TOLERANCE:
+        fillHorizontalStiffnessMatrix(math.copysign(1.0, c), L, E, A, I, K)
+    elif abs(c) < AXIS_TOLERANCE:
+        fillVerticalStiffnessMatrix(math.copysign(1.0, s), L, E, A, I, K)
+    else:
+        fillGeneralStiffnessMatrix(c, s, L, E, A, I, K)
+
+def fillStiffnessMatrices(c, s, L, E, A, I, K):
+    """
+    Fills the 6x6 stiffness matrices of several bars at once, one per row of the given arrays.
+
+    Horizontal and vertical bars get exact zeros, as with the specialized kernels of fillStiffnessMatrix.
+
+    :param c: Cosine of each bar angle.
+    :type c: numpy.ndarray
+    :param s: Sine of each bar angle.
+    :type s: numpy.ndarray
+    :param L: Length of each bar.
+    :type L: numpy.ndarray
+    :param E: Young's modulus of each bar.
+    :type E: numpy.ndarray
+    :param A: Cross-sectional area of each bar.
+    :type A: numpy.ndarray
+    :param I: Inertia Momentum of each bar.
+    :type I: numpy.ndarray
+    :param K: The array where the stiffness matrices are written, with shape (n_bars, 6, 6).
+    :type K: numpy.ndarray
+    """
+    horizontal = np.abs(s) < AXIS_TOLERANCE
+    vertical = ~horizontal & (np.abs(c) < AXIS_TOLERANCE)
+    c = np.where(horizontal, np.copysign(1.0, c), np.where(vertical, 0.0, c))
+    s = np.where(vertical, np.copysign(1.0, s), np.where(horizontal, 0.0, s))
+
+    axial_c2_bending_s2, axial_s2_bending_c2, axial_bending_cs, k3Ls, k3Lc, kL2 = calculateStiffnessTerms(c, s, L, E, A, I)
+
+    K[:, 0, 0] = K[:, 3, 3] = axial_c2_bending_s2
+    K[:, 0, 3] = -axial_c2_bending_s2
+    K[:, 1, 1] = K[:, 4, 4] = axial_s2_bending_c2
+    K[:, 1, 4] = -axial_s2_bending_c2
+    K[:, 0, 1] = K[:, 3, 4] = axial_bending_cs
+    K[:, 0, 4] = K[:, 1, 3] = -axial_bending_cs
+    K[:, 0, 2] = K[:, 0, 5] = -k3Ls
+    K[:, 2, 3] = K[:, 3, 5] = k3Ls
+    K[:, 1, 2] = K[:, 1, 5] = k3Lc
+    K[:, 2, 4] = K[:, 4, 5] = -k3Lc
+    K[:, 2, 2] = K[:, 5, 5] = 2 * kL2
+    K[:, 2, 5] = kL2
+
+    lower_i, lower_j = np.tril_indices(6, -1)
+    K[:, lower_i, lower_j] = K[:, lower_j, lower_i]
+
+@njit(cache=True)
+def fillForceVector(L, total_q_x, total_q_y, shape_functions, weights, force_vector):
+    """
+    Fills the local force vector of a bar from the loads sampled at the quadrature points.
+
+    :param L: Bar length.
+    :type L: float
+    :param total_q_x: Local axial load at each quadrature point.
+    :type total_q_x: numpy.ndarray
+    :param total_q_y: Local transverse load at each quadrature point.
+    :type total_q_y: numpy.ndarray
+    :param shape_functions: Shape functions tabulated at the quadrature points of the reference element.
+    :type shape_functions: numpy.ndarray
+    :param weights: Quadrature weights, scaled to the bar length.
+    :type weights: numpy.ndarray
+    :param force_vector: The array where the force vector is written.
+    :type force_vector: numpy.ndarray
+    """
+    force_vector[:] = 0.0
+    for i in range(weights.shape[0]):
+        q_x = total_q_x[i] * weights[i]
+        q_y = total_q_y[i] * weights[i]
+        force_vector[0] += shape_functions[0, i] * q_x
+        force_vector[1] += shape_functions[1, i] * q_y
+        force_vector[2] += shape_functions[2, i] * q_y
+        force_vector[3] += shape_functions[3, i] * q_x
+        force_vector[4] += shape_functions[4, i] * q_y
+        force_vector[5] += shape_functions[5, i] * q_y
+    force_vector[2] *= L
+    force_vector[5] *= L
+
 class Bar:
     def __init__(self,index, left_node, right_node, E, A, I, global_q_x=0, local_q_x=0, global_q_y=0, local_q_y=0):
         """
@@ -28,6 +390,9 @@ class Bar:
         :type global_q_y: function
         :param local_q_y: Distributed load in the y-direction (Local).
         :type local_q_y: function
+
+        Load functions with a ``polynomial_degree`` attribute up to GAUSS_EXACT_LOAD_DEGREE are
+        integrated exactly by Gauss quadrature; other load functions fall back to adaptive quadrature.
         """
         self.index = index 
         self.left_node = left_node
@@ -35,11 +400,10 @@ class Bar:
         self.E = E
         self.A = A
         self.I = I
+        self.dx, self.dy = self.calculateBarProjections()
         self.L = self.calculateBarLength()
-        self.Li = self.calculateBarLength()
+        self.Li = self.L
         self.angle = self.getBarAngle()
-        self.rotation_matrix_6x6, self.rotation_matrix_3x3 = self.calculateRotationMatrix()
-        self.stiffness_matrix = self.calculateStiffnessMatrix()
         self.global_loads = [
             (lambda x, val=global_q_x: val if isinstance(global_q_x, (int, float)) else global_q_x(x)),
             (lambda y, val=global_q_y: val if isinstance(global_q_y, (int, float)) else global_q_y(y))
@@ -48,7 +412,7 @@ class Bar:
             (lambda x, val=local_q_x: val if isinstance(local_q_x, (int, float)) else local_q_x(x)),
             (lambda y, val=local_q_y: val if isinstance(local_q_y, (int, float)) else local_q_y(y))
         ]
-        self.force_vector = self.calculateForceVector()
+        self.polynomial_loads = all(isPolynomialLoad(q) for q in (global_q_x, local_q_x, global_q_y, local_q_y))
         self.N = 0
         self.sigma = 0
         self.V = 0
@@ -60,6 +424,17 @@ class Bar:
         """
         return self.L
     
+    def calculateBarProjections(self):
+        """
+        Calculate the projections of the bar on the x and y axes.
+        
+        :return: The horizontal and vertical projections of the bar.
+        :rtype: tuple(float, float)
+        """
+        dx = self.right_node.position[0] - self.left_node.position[0]
+        dy = self.right_node.position[1] - self.left_node.position[1]
+        return float(dx), float(dy)
+
     def calculateBarLength(self):
         """
         Calculate the length of the bar.
@@ -67,7 +442,7 @@ class Bar:
         :return: The length of the bar.
         :rtype: float
         """
-        return np.linalg.norm(self.left_node.position - self.right_node.position)
+        return math.hypot(self.dx, self.dy)
     
     def getBarAngle(self):
         """
@@ -76,16 +451,21 @@ class Bar:
         :return: The angle of the bar
         :rtype: float
         """
-        dx = self.right_node.position[0] - self.left_node.position[0]
-        dy = self.right_node.position[1] - self.left_node.position[1]
-        
-        if dx == 0:  
-            if dy > 0:
-                return np.pi / 2  
-            else:   
-                return -np.pi / 2  
-        else:
-            return np.arctan(dy / dx)
+        return math.atan2(self.dy, self.dx)
+
+    @functools.cached_property
+    def rotation_matrix_6x6(self):
+        """
+        The 6x6 rotation matrix of the bar, calculated on first access.
+        """
+        return self.calculateRotationMatrix()[0]
+
+    @functools.cached_property
+    def rotation_matrix_3x3(self):
+        """
+        The 3x3 rotation matrix of the bar, calculated on first access.
+        """
+        return self.calculateRotationMatrix()[1]
 
     def calculateRotationMatrix(self):
         """
@@ -93,31 +473,14 @@ class Bar:
 
         The rotation matrices are used to rotate a vector or a set of points in 3D space.
         The 6x6 rotation matrix is used to rotate a 6-dimensional vector, while the 3x3
-        rotation matrix is used to rotate a 3-dimensional vector.
+        rotation matrix is used to rotate a 3-dimensional vector. The cosine and sine of
+        the 3x3 matrix are also used by the stiffness matrix and force vector, so every
+        bar quantity uses the same (possibly shared) values.
 
         :return: A tuple containing the 6x6 and 3x3 rotation matrices.
         :rtype: tuple(numpy.ndarray, numpy.ndarray)
         """
-        c = np.cos(self.angle)
-        s = np.sin(self.angle)
-
-        R_6 = np.array([
-            [c, -s, 0, 0, 0, 0],
-            [s,  c, 0, 0, 0, 0],
-            [0,  0, 1, 0, 0, 0],
-            [0,  0, 0, c, -s, 0],
-            [0,  0, 0, s,  c, 0],
-            [0,  0, 0, 0,  0, 1]
-        ])
-        
-        R_3 = np.array([
-            [c, -s, 0],
-            [s,  c, 0],
-            [0,  0, 1]
-        ])
-
-
-        return R_6, R_3
+        return calculateRotationMatrices(self.angle)
     
     def calculateForceVector(self):
         """
@@ -126,35 +489,46 @@ class Bar:
         :return: The force vector.
         :rtype: numpy.ndarray
         """
-        force_vector = np.zeros(6)
-        c = np.cos(self.angle)
-        s = np.sin(self.angle)
-        
-        phi_1 = lambda x: x / self.L
-        phi_2 = lambda x: 2 * (x**3) / self.L**3 - 3 * (x**2) / self.L**2 + 1
-        phi_3 = lambda x: (x**3) / (self.L**2) - 2 * (x**2) / (self.L) + x
-        
-        phi_4 = lambda x: 1 - x / self.L
-        phi_5 = lambda x: -2 * (x**3) / self.L**3 + 3 * (x**2) / self.L**2
-        phi_6 = lambda x: (x**3) / self.L**2 - (x**2) / self.L
-        
-        decomposed_q_x = lambda x: self.global_loads[0](x) * c - self.global_loads[1](x) * s
-        decomposed_q_y = lambda x: self.global_loads[0](x) * s + self.global_loads[1](x) * c
-        total_q_x = lambda x: self.local_loads[0](x) + decomposed_q_x(x)
-        total_q_y = lambda x: self.local_loads[1](x) + decomposed_q_y(x)
+        force_vector = np.empty(6)
+        R_3 = self.rotation_matrix_3x3
+        c = R_3[0, 0]
+        s = R_3[1, 0]
+        L = self.L
+
+        if self.polynomial_loads:
+            x = GAUSS_U * L
+            weights = 0.5 * L * GAUSS_WEIGHTS
+
+            global_q_x = evaluateLoad(self.global_loads[0], x)
+            global_q_y = evaluateLoad(self.global_loads[1], x)
+            total_q_x = evaluateLoad(self.local_loads[0], x) + global_q_x * c - global_q_y * s
+            total_q_y = evaluateLoad(self.local_loads[1], x) + global_q_x * s + global_q_y * c
+
+            fillForceVector(L, total_q_x, total_q_y, SHAPE_FUNCTIONS, weights, force_vector)
+        else:
+            total_q_x = lambda x: self.local_loads[0](x) + self.global_loads[0](x) * c - self.global_loads[1](x) * s
+            total_q_y = lambda x: self.local_loads[1](x) + self.global_loads[0](x) * s + self.global_loads[1](x) * c
+            loads = [total_q_x, total_q_y, total_q_y, total_q_x, total_q_y, total_q_y]
 
-        force_vector[0] = quad(lambda x: total_q_x(x) * phi_1(x), 0, self.L)[0]
-        force_vector[1] = quad(lambda x: total_q_y(x) * phi_2(x), 0, self.L)[0]
-        force_vector[2] = quad(lambda x: total_q_y(x) * phi_3(x), 0, self.L)[0]
-        force_vector[3] = quad(lambda x: total_q_x(x) * phi_4(x), 0, self.L)[0]
-        force_vector[4] = quad(lambda x: total_q_y(x) * phi_5(x), 0, self.L)[0]
-        force_vector[5] = quad(lambda x: total_q_y(x) * phi_6(x), 0, self.L)[0]
+            for i, (shape_function, q) in enumerate(zip(REFERENCE_SHAPE_FUNCTIONS, loads)):
+                force_vector[i] = quad(lambda x: shape_function(x / L) * q(x), 0, L)[0]
+            force_vector[2] *= L
+            force_vector[5] *= L
 
-        global_force_vector = self.rotation_matrix_6x6 @ force_vector
+        # Each row of the (2, 3) view holds one node: row @ R_3.T == R_3 @ node forces.
+        global_force_vector = np.empty(6)
+        np.matmul(force_vector.reshape(2, 3), R_3.T, out=global_force_vector.reshape(2, 3))
 
         return global_force_vector
 
     
+    @functools.cached_property
+    def force_vector(self):
+        """
+        The global force vector of the bar, calculated on first access.
+        """
+        return self.calculateForceVector()
+
     def getForceVector(self):
         """
         Get the force vector of the bar.
@@ -171,23 +545,19 @@ class Bar:
         :return: The stiffness matrix.
         :rtype: numpy.ndarray
         """
-        c = np.cos(self.angle)
-        s = np.sin(self.angle)
-        mu = self.A * self.L**2 / (2 * self.I)
-        k = 2 * self.E * self.I / self.L**3
-        L = self.L
-        
-        K = k * np.array([
-            [mu * c**2 + 6 * s**2, (mu - 6) * c * s, -3 * L * s, -mu * c**2 - 6 * s**2, -(mu - 6) * c * s, -3 * L * s],
-            [(mu - 6) * c * s, mu * s**2 + 6 * c**2, 3 * L * c, -(mu - 6) * c * s, -mu * s**2 - 6 * c**2, 3 * L * c],
-            [-3 * L * s, 3 * L * c, 2 * L**2, 3 * L * s, -3 * L * c, L**2],
-            [-mu * c**2 - 6 * s**2, -(mu - 6) * c * s, 3 * L * s, mu * c**2 + 6 * s**2, (mu - 6) * c * s, 3 * L * s],
-            [-(mu - 6) * c * s, -mu * s**2 - 6 * c**2, -3 * L * c, (mu - 6) * c * s, mu * s**2 + 6 * c**2, -3 * L * c],
-            [-3 * L * s, 3 * L * c, L**2, 3 * L * s, -3 * L * c, 2 * L**2]
-        ])
+        K = np.empty((6, 6))
+        R_3 = self.rotation_matrix_3x3
+        fillStiffnessMatrix(R_3[0, 0], R_3[1, 0], self.L, self.E, self.A, self.I, K)
         
         return K
         
+    @functools.cached_property
+    def stiffness_matrix(self):
+        """
+        The stiffness matrix of the bar, calculated on first access.
+        """
+        return self.calculateStiffnessMatrix()
+
     def getStiffnessMatrix(self):
         """
         Gets the stiffness matrix of the bar.
@@ -197,18 +567,24 @@ class Bar:
         """
         return self.stiffness_matrix
 
+    def getNodesLocalDisplacements(self):
+        """
+        Gets the displacements of both nodes in the bar local coordinates.
+
+        :return: The local displacements of the left and right nodes.
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        displacements = np.vstack([self.left_node.getDisplacement(), self.right_node.getDisplacement()])
+        local_displacements = np.matmul(displacements, self.rotation_matrix_3x3)
+
+        return local_displacements[0], local_displacements[1]
+
     def calculateBarNormalAndStress(self):
         """
         Calculates the stress and normal force of the bar.
         """
         
-        left_displacements = self.left_node.getDisplacement()
-        right_displacements = self.right_node.getDisplacement()
-    
-        R_T = self.rotation_matrix_3x3.T
-        
-        local_left_displacements = R_T @ left_displacements
-        local_right_displacements = R_T @ right_displacements
+        local_left_displacements, local_right_displacements = self.getNodesLocalDisplacements()
         
         u_l1 = local_left_displacements[0]
         u_l2 = local_right_displacements[0]
@@ -240,13 +616,7 @@ class Bar:
         Calculates the shear force and bending moment of the bar.
         """
         
-        left_displacements = self.left_node.getDisplacement()
-        right_displacements = self.right_node.getDisplacement()
-    
-        R_T = self.rotation_matrix_3x3.T
-        
-        local_left_displacements = R_T @ left_displacements
-        local_right_displacements = R_T @ right_displacements
+        local_left_displacements, local_right_displacements = self.getNodesLocalDisplacements()
         
         v_l1 = local_left_displacements[1]  
         theta_l2 = local_left_displacements[2]
@@ -291,5 +661,75 @@ class Bar:
         M_symbolic = self.M(x)
         
         return M_symbolic
-    
-    
\ No newline at end of file
+
+
+class BarArray:
+    def __init__(self, list_of_bars):
+        """
+        Initializes a BarArray object, storing the bars properties as parallel arrays.
+
+        :param list_of_bars: List of bars.
+        :type list_of_bars: list of _Bar_
+        """
+        self.bars = list_of_bars
+        self.c = np.array([bar.rotation_matrix_3x3[0, 0] for bar in self.bars], dtype=np.float64)
+        self.s = np.array([bar.rotation_matrix_3x3[1, 0] for bar in self.bars], dtype=np.float64)
+        self.L = np.array([bar.L for bar in self.bars], dtype=np.float64)
+        self.E = np.array([bar.E for bar in self.bars], dtype=np.float64)
+        self.A = np.array([bar.A for bar in self.bars], dtype=np.float64)
+        self.I = np.array([bar.I for bar in self.bars], dtype=np.float64)
+        self.left_nodes_indexes = np.array([bar.left_node.index for bar in self.bars], dtype=np.int64)
+        self.right_nodes_indexes = np.array([bar.right_node.index for bar in self.bars], dtype=np.int64)
+
+    def __len__(self):
+        """
+        Gets the number of bars.
+
+        :return: The number of bars.
+        :rtype: int
+        """
+        return len(self.bars)
+
+    def __getitem__(self, i):
+        """
+        Gets a bar by its position in the array.
+
+        :param i: The position of the bar.
+        :type i: int
+        :return: The bar.
+        :rtype: _Bar_
+        """
+        return self.bars[i]
+
+    def calculateStiffnessMatrices(self):
+        """
+        Calculates the stiffness matrices of all bars at once.
+
+        :return: The stiffness matrices, one per bar.
+        :rtype: numpy.ndarray with shape (n_bars, 6, 6)
+        """
+        K = np.empty((len(self), 6, 6))
+        fillStiffnessMatrices(self.c, self.s, self.L, self.E, self.A, self.I, K)
+
+        return K
+
+    def getForceVectors(self):
+        """
+        Gets the global force vectors of all bars.
+
+        :return: The force vectors, one per bar.
+        :rtype: numpy.ndarray with shape (n_bars, 6)
+        """
+        return np.array([bar.getForceVector() for bar in self.bars], dtype=np.float64).reshape(len(self), 6)
+
+    def getDofIndexes(self):
+        """
+        Gets the global degrees of freedom of each bar, ordered as in the bar stiffness matrix.
+
+        :return: The degrees of freedom indexes.
+        :rtype: numpy.ndarray with shape (n_bars, 6)
+        """
+        local_dofs = np.arange(3)
+        left_dofs = 3 * self.left_nodes_indexes[:, None] + local_dofs
+        right_dofs = 3 * self.right_nodes_indexes[:, None] + local_dofs
+        return np.hstack([left_dofs, right_dofs])
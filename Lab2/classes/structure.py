@@ -2,7 +2,7 @@ import numpy as np
 import sympy as sp
 import matplotlib.pyplot as plt
 from node import Node
-from bar import Bar
+from bar import Bar, BarArray
 
 class Structure:
     def __init__(self, list_of_nodes, list_of_bars):
@@ -18,6 +18,7 @@ class Structure:
         self.bars = list_of_bars
         self.num_nodes = len(self.nodes)
         self.dof_per_node = 3
+        self.bar_array = BarArray(self.bars)
         self.K = self.calculateStiffnessMatrix()
         self.f = self.calculateForceVector()
         self.symbols = []
@@ -39,16 +40,10 @@ class Structure:
         global_size = self.num_nodes * self.dof_per_node
         global_matrix = np.zeros((global_size, global_size))
 
-        for bar in self.bars:
-            bar_matrix = bar.getStiffnessMatrix()
-            
-            left_node_index = bar.left_node.index * self.dof_per_node
-            right_node_index = bar.right_node.index * self.dof_per_node
-            
-            global_matrix[left_node_index:left_node_index+self.dof_per_node, left_node_index:left_node_index+self.dof_per_node] += bar_matrix[:self.dof_per_node, :self.dof_per_node]
-            global_matrix[left_node_index:left_node_index+self.dof_per_node, right_node_index:right_node_index+self.dof_per_node] += bar_matrix[:self.dof_per_node, self.dof_per_node:]
-            global_matrix[right_node_index:right_node_index+self.dof_per_node, left_node_index:left_node_index+self.dof_per_node] += bar_matrix[self.dof_per_node:, :self.dof_per_node]
-            global_matrix[right_node_index:right_node_index+self.dof_per_node, right_node_index:right_node_index+self.dof_per_node] += bar_matrix[self.dof_per_node:, self.dof_per_node:]
+        bars_matrices = self.bar_array.calculateStiffnessMatrices()
+        dofs = self.bar_array.getDofIndexes()
+
+        np.add.at(global_matrix, (dofs[:, :, None], dofs[:, None, :]), bars_matrices)
             
         return global_matrix
 
@@ -70,23 +65,16 @@ class Structure:
         """
         force_vector = np.zeros(self.dof_per_node * len(self.nodes))
 
-        for bar in self.bars:
-            bar_global_force_vector = bar.getForceVector()
-            
-            left_node_index = bar.left_node.index * self.dof_per_node
-            right_node_index = bar.right_node.index * self.dof_per_node
-            
-            force_vector[left_node_index:left_node_index+self.dof_per_node] += bar_global_force_vector[:self.dof_per_node]
-            force_vector[right_node_index:right_node_index+self.dof_per_node] += bar_global_force_vector[self.dof_per_node:]
-            
-        global_concentrated_forces = np.zeros(self.dof_per_node * len(self.nodes))
+        bars_force_vectors = self.bar_array.getForceVectors()
+        dofs = self.bar_array.getDofIndexes()
 
-        for node in self.nodes:
-            node_global_concentrated_forces = node.getGlobalForces()
-            i = node.index * 3
-            global_concentrated_forces[i:i+3] = node_global_concentrated_forces
+        np.add.at(force_vector, dofs.ravel(), bars_force_vectors.ravel())
+
+        global_concentrated_forces = np.zeros((len(self.nodes), self.dof_per_node))
+        nodes_indexes = [node.index for node in self.nodes]
+        global_concentrated_forces[nodes_indexes] = [node.getGlobalForces() for node in self.nodes]
 
-        total_force_vector = force_vector + global_concentrated_forces
+        total_force_vector = force_vector + global_concentrated_forces.ravel()
         
         return total_force_vector
             
@@ -28,7 +28,9 @@ def getLinearLoad(start_value, final_value, L):
     :return: A function that computes the load at a given point x, where 0 <= x <= L.
     :rtype: function
     """
-    return lambda x: start_value + (final_value - start_value) * (x / L)
+    linear_load = lambda x: start_value + (final_value - start_value) * (x / L)
+    linear_load.polynomial_degree = 1
+    return linear_load
 
 load = getLinearLoad(90e3, 30e3, L1 + L2)
 
@@ -46,33 +48,33 @@ nodes = [node_1, node_2, node_3, node_4, node_5, node_6]
 
 q0 = load(0)
 qf = load(L1/3)
-load_1 = getLinearLoad(q0, qf, L1/3)
+load_1 = getLinearLoad(-q0, -qf, L1/3)
 
-bar_1 = Bar(index = 1, left_node = node_1, right_node = node_2, E = E, A = A, I = I, local_q_y = lambda x: -load_1(x))
+bar_1 = Bar(index = 1, left_node = node_1, right_node = node_2, E = E, A = A, I = I, local_q_y = load_1)
 
 q0 = load(L1/3)
 qf = load(2*L1/3)
-load_2 = getLinearLoad(q0, qf, L1/3)
+load_2 = getLinearLoad(-q0, -qf, L1/3)
 
-bar_2 = Bar(index = 2, left_node = node_2, right_node = node_3, E = E, A = A, I = I, local_q_y = lambda x: -load_2(x))
+bar_2 = Bar(index = 2, left_node = node_2, right_node = node_3, E = E, A = A, I = I, local_q_y = load_2)
 
 q0 = load(2*L1/3)
 qf = load(L1)
-load_3 = getLinearLoad(q0, qf, L1/3)
+load_3 = getLinearLoad(-q0, -qf, L1/3)
 
-bar_3 = Bar(index = 3, left_node = node_3, right_node = node_4, E = E, A = A, I = I, local_q_y = lambda x: -load_3(x))
+bar_3 = Bar(index = 3, left_node = node_3, right_node = node_4, E = E, A = A, I = I, local_q_y = load_3)
 
 q0 = load(L1)
 qf = load(L1 + 0.5*L2)
-load_4 = getLinearLoad(q0, qf, 0.5*L2)
+load_4 = getLinearLoad(-q0, -qf, 0.5*L2)
 
-bar_4 = Bar(index = 4, left_node = node_4, right_node = node_5, E = E, A = A, I = I, local_q_y = lambda x: -load_4(x))
+bar_4 = Bar(index = 4, left_node = node_4, right_node = node_5, E = E, A = A, I = I, local_q_y = load_4)
 
 q0 = load(L1 + 0.5*L2)
 qf = load(L1 + L2)
-load_5 = getLinearLoad(q0, qf, 0.5*L2)
+load_5 = getLinearLoad(-q0, -qf, 0.5*L2)
 
-bar_5 = Bar(index = 5, left_node = node_5, right_node = node_6, E = E, A = A, I = I, local_q_y = lambda x: -load_5(x))
+bar_5 = Bar(index = 5, left_node = node_5, right_node = node_6, E = E, A = A, I = I, local_q_y = load_5)
 
 bars = [bar_1, bar_2, bar_3, bar_4, bar_5] 
 